@@ -1,14 +1,17 @@
 import os
+import time
+import asyncio
 import django
+import orjson
+import xxhash
 import traceback
-from pydantic import BaseModel
-from fastapi import FastAPI, HTTPException, Request, Query
-from fastapi.responses import JSONResponse
-from fastapi.concurrency import run_in_threadpool
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field
+from fastapi import FastAPI, HTTPException, Request, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
 
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
+import redis.asyncio as aioredis
 
 # -------------------------------------------------------------------
 # Django setup
@@ -19,117 +22,318 @@ os.environ.setdefault(
 )
 django.setup()
 
+from django.db import IntegrityError
+from django.utils import timezone
+
 from dbcore.kvstore.models import Item
 
 # -------------------------------------------------------------------
 # FastAPI + Rate Limiter
 # -------------------------------------------------------------------
-app = FastAPI(title="Botgauge Key-Value API")
+# orjson encodes the response dicts several times faster than stdlib
+# json; this matters most on the list and bulk endpoints.
+app = FastAPI(
+    title="Botgauge Key-Value API",
+    default_response_class=ORJSONResponse,
+)
+
+# Rate-limit state lives in Redis so the budget is shared across
+# uvicorn workers instead of being limit * N with per-process counters.
+rate_limit_redis = aioredis.from_url(
+    os.environ.get("RATELIMIT_STORAGE_URI", "redis://localhost:6379/0")
+)
+
+# Atomic token bucket: refill from elapsed time, consume one token, and
+# either allow (-1) or report the seconds until the next token.
+_TOKEN_BUCKET_LUA = """
+local tokens = tonumber(redis.call('HGET', KEYS[1], 't'))
+local ts = tonumber(redis.call('HGET', KEYS[1], 'ts'))
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+if tokens == nil then
+    tokens = limit
+    ts = now
+end
+tokens = math.min(limit, tokens + (now - ts) * limit / period)
+if tokens >= 1 then
+    redis.call('HSET', KEYS[1], 't', tokens - 1, 'ts', now)
+    redis.call('EXPIRE', KEYS[1], period * 2)
+    return -1
+end
+redis.call('HSET', KEYS[1], 't', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], period * 2)
+return math.ceil((1 - tokens) * period / limit)
+"""
+
+_RATE_LIMIT_BODY = b'{"detail":"Rate limit exceeded. Try again later."}'
 
-limiter = Limiter(key_func=get_remote_address)
-app.state.limiter = limiter
 
+@lru_cache(maxsize=65536)
+def _bucket_key(ip: str, limit: int) -> str:
+    """
+    Render a client's Redis bucket key once and reuse it: the IP is
+    XXH3-hashed to a fixed 64-bit hex token (short even for IPv6) and
+    the per-(ip, limit) string is served from the LRU on repeat visits
+    instead of being re-formatted every request.
+    """
+    return "rl:%x:%d" % (xxhash.xxh3_64_intdigest(ip.encode()), limit)
 
-@app.exception_handler(RateLimitExceeded)
-def rate_limit_handler(request: Request, exc: RateLimitExceeded):
-    return JSONResponse(
+
+@lru_cache(maxsize=128)
+def _rate_limit_response(retry_after: int) -> Response:
+    """
+    429 responses are identical except for Retry-After, which the token
+    bucket caps at the refill period, so the full set of responses is
+    tiny and can be built once. A plain Response is stateless and safe
+    to re-send.
+    """
+    return Response(
+        content=_RATE_LIMIT_BODY,
         status_code=429,
-        content={"detail": "Rate limit exceeded. Try again later."},
+        media_type="application/json",
+        headers={"Retry-After": str(retry_after)},
     )
 
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    """
+    One Redis EVALSHA per request replaces the per-endpoint SlowAPI
+    decorator stack; denied requests short-circuit before routing.
+    """
+
+    def __init__(self, app, limit: int = 60, period: int = 60,
+                 bulk_limit: int = 10):
+        super().__init__(app)
+        self.limit = limit
+        self.period = period
+        self.bulk_limit = bulk_limit
+        self._script = rate_limit_redis.register_script(_TOKEN_BUCKET_LUA)
+
+    async def dispatch(self, request: Request, call_next):
+        path = request.url.path
+        if not path.startswith("/items"):
+            return await call_next(request)
+
+        # Bulk writes do more work per call, so they get a lower budget
+        # tracked in a separate bucket.
+        if path == "/items/bulk" and request.method == "POST":
+            limit = self.bulk_limit
+        else:
+            limit = self.limit
+
+        ip = request.client.host if request.client else "unknown"
+        retry_after = await self._script(
+            keys=[_bucket_key(ip, limit)],
+            args=[limit, self.period, time.time()],
+        )
+
+        if retry_after >= 0:
+            return _rate_limit_response(int(retry_after))
+
+        return await call_next(request)
+
+
+app.add_middleware(RateLimitMiddleware, limit=60, period=60, bulk_limit=10)
+
+# Read-through cache for GET /items/{key}: repeated reads of a hot key
+# hit Redis instead of Postgres. Writes invalidate (never populate) the
+# key; the TTL is a safety net against missed invalidations.
+cache = aioredis.from_url(
+    os.environ.get("CACHE_REDIS_URL", "redis://localhost:6379/1"),
+    decode_responses=True,
+)
+CACHE_TTL = 300
+
+
+def cache_key(key: str) -> str:
+    return f"kv:{key}"
+
+
+# Singleflight: concurrent cache misses for the same key share one DB
+# fetch per worker instead of stampeding Postgres. The ceiling timeout
+# keeps a hung leader fetch from wedging its followers.
+_inflight: dict[str, asyncio.Future] = {}
+_INFLIGHT_TIMEOUT = 5.0
+
 # -------------------------------------------------------------------
 # Pydantic Models
 # -------------------------------------------------------------------
+# extra="forbid" rejects unknown fields at the Rust-validator level;
+# the length caps stop oversized keys/values before they reach the DB.
 class ItemCreate(BaseModel):
-    key: str
-    value: str
+    model_config = ConfigDict(extra="forbid")
+
+    key: str = Field(min_length=1, max_length=256)
+    value: str = Field(max_length=65536)
+
+
+class ItemsBulkCreate(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    items: list[ItemCreate] = Field(max_length=1000)
 
 # -------------------------------------------------------------------
 # API Endpoints
 # -------------------------------------------------------------------
 
 @app.post("/items/")
-@limiter.limit("60/minute")
-async def create_item(request: Request, data: ItemCreate):
-    def db_op():
-        if Item.objects.filter(key=data.key).exists():
-            raise ValueError("Key exists")
-        return Item.objects.create(key=data.key, value=data.value)
-
+async def create_item(data: ItemCreate):
     try:
-        item = await run_in_threadpool(db_op)
+        # Single atomic INSERT; the unique index on key rejects duplicates,
+        # so no exists() precheck (and no TOCTOU race) is needed.
+        item = await Item.objects.acreate(key=data.key, value=data.value)
+        await cache.delete(cache_key(data.key))
         return {"key": item.key, "value": item.value}
 
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError:
+        raise HTTPException(status_code=400, detail="Key exists")
     except Exception:
         traceback.print_exc()
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+# Registered before /items/{key} so "bulk" is not captured as a key.
+@app.post("/items/bulk")
+async def create_items_bulk(data: ItemsBulkCreate):
+    objs = [Item(key=i.key, value=i.value) for i in data.items]
+    # One INSERT per 1000 rows; duplicate keys are skipped silently
+    # (ignore_conflicts cannot report which rows were ignored).
+    await Item.objects.abulk_create(
+        objs, ignore_conflicts=True, batch_size=1000
+    )
+
+    keys = [obj.key for obj in objs]
+    if keys:
+        await cache.delete(*[cache_key(k) for k in keys])
+
+    return {"requested": len(keys), "keys": keys}
+
+
+@app.get("/items/bulk")
+async def get_items_bulk(keys: str = Query(...)):
+    wanted = [k for k in keys.split(",") if k]
+    items = [
+        row
+        async for row in Item.objects.filter(key__in=wanted).values(
+            "key", "value"
+        )
+    ]
+    return {"items": items}
+
+
 @app.get("/items/{key}")
-@limiter.limit("60/minute")
-async def get_item(request: Request, key: str):
-    def db_op():
-        return Item.objects.get(key=key)
+async def get_item(key: str):
+    cached = await cache.get(cache_key(key))
+    if cached is not None:
+        return {"key": key, "value": cached}
 
+    # Follow the in-flight fetch if another request already missed on
+    # this key; the shield keeps a cancelled follower from cancelling
+    # the leader's future.
+    existing = _inflight.get(key)
+    if existing is not None:
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(existing), _INFLIGHT_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            raise HTTPException(
+                status_code=504,
+                detail="Timed out waiting for in-flight fetch",
+            )
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
     try:
-        item = await run_in_threadpool(db_op)
-        return {"key": item.key, "value": item.value}
-    except Item.DoesNotExist:
-        raise HTTPException(status_code=404, detail="Key not found")
+        try:
+            item = await Item.objects.only("key", "value").aget(key=key)
+        except Item.DoesNotExist:
+            exc = HTTPException(status_code=404, detail="Key not found")
+            fut.set_exception(exc)
+            fut.exception()  # retrieved here in case no follower awaits
+            raise exc
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()
+            raise
 
+        result = {"key": item.key, "value": item.value}
+        fut.set_result(result)
+    finally:
+        # Covers exits that skip the handlers above, e.g. the leader
+        # being cancelled on client disconnect (CancelledError is a
+        # BaseException): fail followers over immediately instead of
+        # leaving them to wait out the timeout on a dead future.
+        if not fut.done():
+            fut.set_exception(
+                HTTPException(
+                    status_code=503,
+                    detail="In-flight fetch was cancelled",
+                )
+            )
+            fut.exception()
+        _inflight.pop(key, None)
 
-@app.put("/items/{key}")
-@limiter.limit("60/minute")
-async def update_item(request: Request, key: str, value: str):
-    def db_op():
-        item = Item.objects.get(key=key)
-        item.value = value
-        item.save()
-        return item
+    await cache.set(cache_key(key), item.value, ex=CACHE_TTL)
+    return result
 
-    try:
-        item = await run_in_threadpool(db_op)
-        return {"key": item.key, "value": item.value}
-    except Item.DoesNotExist:
+
+@app.put("/items/{key}")
+async def update_item(key: str, value: str):
+    # Single UPDATE instead of fetch + full-row save. update() bypasses
+    # auto_now, so updated_at is set explicitly.
+    updated = await Item.objects.filter(key=key).aupdate(
+        value=value, updated_at=timezone.now()
+    )
+    if updated == 0:
         raise HTTPException(status_code=404, detail="Key not found")
 
+    await cache.delete(cache_key(key))
+    return {"key": key, "value": value}
 
-@app.delete("/items/{key}")
-@limiter.limit("60/minute")
-async def delete_item(request: Request, key: str):
-    def db_op():
-        return Item.objects.filter(key=key).delete()
 
-    deleted, _ = await run_in_threadpool(db_op)
+@app.delete("/items/{key}")
+async def delete_item(key: str):
+    deleted, _ = await Item.objects.filter(key=key).adelete()
     if deleted == 0:
         raise HTTPException(status_code=404, detail="Key not found")
 
+    await cache.delete(cache_key(key))
     return {"message": "Deleted successfully"}
 
 
 @app.get("/items/")
-@limiter.limit("60/minute")
 async def list_items(
-    request: Request,
-    page: int = Query(1, ge=1),
+    after_id: int | None = Query(None, ge=1),
     page_size: int = Query(10, ge=1, le=100),
 ):
-    def db_op():
-        qs = Item.objects.all().order_by("id")
-        total = qs.count()
+    # Keyset pagination: seek past the cursor instead of COUNT(*) + OFFSET,
+    # so cost stays O(page_size) regardless of table size or page depth.
+    qs = Item.objects.all().order_by("id")
+    if after_id is not None:
+        qs = qs.filter(id__gt=after_id)
 
-        start = (page - 1) * page_size
-        end = start + page_size
+    async def rows():
+        # Encode and flush one row at a time so peak memory stays at a
+        # single row and bytes start flowing before the cursor is done.
+        # The extra row beyond page_size only signals another page.
+        yield b'{"page_size":%d,"items":[' % page_size
 
-        items = list(qs[start:end].values("key", "value"))
+        emitted = 0
+        last_id = None
+        next_cursor = None
+        values = qs[: page_size + 1].values("id", "key", "value")
+        async for row in values.aiterator(chunk_size=100):
+            if emitted >= page_size:
+                next_cursor = last_id
+                break
+            if emitted:
+                yield b","
+            yield orjson.dumps(row)
+            emitted += 1
+            last_id = row["id"]
 
-        return {
-            "page": page,
-            "page_size": page_size,
-            "total": total,
-            "items": items,
-        }
+        yield b'],"next":' + orjson.dumps(next_cursor) + b"}"
 
-    return await run_in_threadpool(db_op)
+    return StreamingResponse(rows(), media_type="application/json")
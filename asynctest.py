@@ -0,0 +1,32 @@
+import asyncio
+
+from client.async_kv_client import AsyncKVClient
+
+
+async def main():
+    async with AsyncKVClient("http://127.0.0.1:8000") as client:
+        # Create
+        await client.create("async_client_test", "hello")
+
+        # Get
+        await client.get("async_client_test")
+
+        # Update
+        await client.update("async_client_test", "updated")
+
+        # List
+        await client.list(page_size=5)
+
+        # Concurrent reads: failures come back as exception objects
+        results = await client.get_many(["async_client_test", "app_name"])
+        for result in results:
+            if isinstance(result, Exception):
+                print("Error:", result)
+            else:
+                print(result)
+
+        # Delete
+        await client.delete("async_client_test")
+
+
+asyncio.run(main())
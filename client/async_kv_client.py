@@ -0,0 +1,171 @@
+import asyncio
+import random
+from typing import Optional
+
+import httpx
+
+from client.kv_client import KVClientError, RateLimitError, parse_retry_after
+
+
+class AsyncKVClient:
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 5.0,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        jitter: float = 0.3,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.jitter = jitter
+
+        # One pooled client for the lifetime of the object; independent
+        # calls can run concurrently over the same connection pool.
+        self._client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+            ),
+        )
+
+    async def close(self):
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    # --------------------------------------------------
+    # Internal request handler with retries
+    # --------------------------------------------------
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[dict] = None,
+        json: Optional[dict] = None,
+    ):
+        for attempt in range(self.max_retries):
+            try:
+                response = await self._client.request(
+                    method=method,
+                    url=path,
+                    params=params,
+                    json=json,
+                )
+            except (httpx.TimeoutException, httpx.TransportError):
+                if attempt == self.max_retries - 1:
+                    raise
+                await asyncio.sleep(self._backoff_delay(attempt))
+                continue
+
+            # Rate limit handling: sleep exactly as long as the server
+            # advised, falling back to exponential backoff.
+            if response.status_code == 429:
+                error = RateLimitError(
+                    "Rate limit exceeded",
+                    retry_after=parse_retry_after(response),
+                )
+                if attempt == self.max_retries - 1:
+                    raise error
+                if error.retry_after is not None:
+                    delay = error.retry_after + random.uniform(0, self.jitter)
+                else:
+                    delay = self._backoff_delay(attempt)
+                await asyncio.sleep(delay)
+                continue
+
+            # Success
+            if response.status_code < 400:
+                return response.json()
+
+            # Client errors (never retried)
+            if response.status_code < 500:
+                raise KVClientError(
+                    f"{response.status_code}: {response.text}"
+                )
+
+            # Server errors → retry
+            if attempt == self.max_retries - 1:
+                raise KVClientError(
+                    f"Server error {response.status_code}"
+                )
+            await asyncio.sleep(self._backoff_delay(attempt))
+
+        raise KVClientError("Max retries exceeded")
+
+    def _backoff_delay(self, attempt: int) -> float:
+        exponential = self.backoff_base * (2 ** attempt)
+        jitter = random.uniform(0, self.jitter)
+        return exponential + jitter
+
+    # --------------------------------------------------
+    # Public API methods
+    # --------------------------------------------------
+
+    async def create(self, key: str, value: str):
+        """
+        POST /items/
+        """
+        return await self._request(
+            "POST",
+            "/items/",
+            json={"key": key, "value": value},
+        )
+
+    async def get(self, key: str):
+        """
+        GET /items/{key}
+        """
+        return await self._request(
+            "GET",
+            f"/items/{key}",
+        )
+
+    async def get_many(self, keys: list):
+        """
+        Fetch many keys concurrently; failures come back as exception
+        objects in the result list instead of aborting the batch.
+        """
+        return await asyncio.gather(
+            *(self.get(key) for key in keys),
+            return_exceptions=True,
+        )
+
+    async def update(self, key: str, value: str):
+        """
+        PUT /items/{key}
+        """
+        return await self._request(
+            "PUT",
+            f"/items/{key}",
+            params={"value": value},
+        )
+
+    async def delete(self, key: str):
+        """
+        DELETE /items/{key}
+        """
+        return await self._request(
+            "DELETE",
+            f"/items/{key}",
+        )
+
+    async def list(self, after_id: Optional[int] = None, page_size: int = 10):
+        """
+        GET /items/?after_id=&page_size=
+        """
+        params = {"page_size": page_size}
+        if after_id is not None:
+            params["after_id"] = after_id
+        return await self._request(
+            "GET",
+            "/items/",
+            params=params,
+        )
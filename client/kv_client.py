@@ -1,7 +1,38 @@
 import time
-import random
 import requests
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
 from typing import Optional
+from urllib3.util.retry import Retry
+
+
+def parse_retry_after(response) -> Optional[float]:
+    """
+    Extract the server-advised wait (seconds) from a 429 response.
+
+    Understands Retry-After as delta-seconds or an HTTP-date, falling
+    back to X-RateLimit-Reset (epoch seconds). Returns None if the
+    server gave no usable hint.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            try:
+                reset_at = parsedate_to_datetime(retry_after)
+                return max(reset_at.timestamp() - time.time(), 0.0)
+            except (TypeError, ValueError):
+                pass
+
+    reset = response.headers.get("X-RateLimit-Reset")
+    if reset:
+        try:
+            return max(float(reset) - time.time(), 0.0)
+        except ValueError:
+            pass
+
+    return None
 
 
 class KVClientError(Exception):
@@ -9,7 +40,9 @@ class KVClientError(Exception):
 
 
 class RateLimitError(KVClientError):
-    pass
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class KVClient:
@@ -20,6 +53,8 @@ class KVClient:
         max_retries: int = 5,
         backoff_base: float = 0.5,
         jitter: float = 0.3,
+        breaker_threshold: int = 10,
+        breaker_cooldown: float = 30.0,
     ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
@@ -27,6 +62,47 @@ class KVClient:
         self.backoff_base = backoff_base
         self.jitter = jitter
 
+        # Circuit breaker: after breaker_threshold consecutive 429s,
+        # fail fast for breaker_cooldown seconds instead of retrying.
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self._consecutive_429 = 0
+        self._breaker_open_until = 0.0
+
+        # Retries run inside urllib3's connection pool: exponential
+        # backoff with jitter, Retry-After honored natively, and POST
+        # excluded from status retries so a create is never replayed
+        # after the server may have committed it.
+        retries = Retry(
+            total=max_retries,
+            backoff_factor=backoff_base,
+            backoff_jitter=jitter,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "PUT", "DELETE", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+        # One pooled session for the client's lifetime: connections are
+        # kept alive and reused instead of a TCP/TLS handshake per call.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=100,
+            max_retries=retries,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self):
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     # --------------------------------------------------
     # Internal request handler with retries
     # --------------------------------------------------
@@ -40,54 +116,51 @@ class KVClient:
     ):
         url = f"{self.base_url}{path}"
 
-        for attempt in range(self.max_retries):
-            try:
-                response = requests.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json,
-                    timeout=self.timeout,
+        remaining = self._breaker_open_until - time.monotonic()
+        if remaining > 0:
+            raise RateLimitError(
+                "Circuit open after repeated 429s",
+                retry_after=remaining,
+            )
+
+        # The adapter's Retry has already retried transient failures by
+        # the time we see a response, so this only maps the outcome.
+        try:
+            response = self._session.request(
+                method=method,
+                url=url,
+                params=params,
+                json=json,
+                timeout=self.timeout,
+            )
+        except (requests.exceptions.Timeout,
+                requests.exceptions.ConnectionError,
+                requests.exceptions.RetryError) as e:
+            raise KVClientError(f"Request failed after retries: {e}")
+
+        # A 429 here means the retry budget was spent while still
+        # rate-limited; repeated occurrences open the breaker.
+        if response.status_code == 429:
+            self._consecutive_429 += 1
+            if self._consecutive_429 >= self.breaker_threshold:
+                self._breaker_open_until = (
+                    time.monotonic() + self.breaker_cooldown
                 )
-
-                # Rate limit handling
-                if response.status_code == 429:
-                    raise RateLimitError("Rate limit exceeded")
-
-                # Success
-                if response.status_code < 400:
-                    return response.json()
-
-                # Client errors (do not retry)
-                if 400 <= response.status_code < 500:
-                    raise KVClientError(
-                        f"{response.status_code}: {response.text}"
-                    )
-
-                # Server errors → retry
-                raise KVClientError(
-                    f"Server error {response.status_code}"
+                raise RateLimitError(
+                    "Circuit opened after "
+                    f"{self._consecutive_429} consecutive 429s",
+                    retry_after=self.breaker_cooldown,
                 )
+            raise RateLimitError(
+                "Rate limit exceeded",
+                retry_after=parse_retry_after(response),
+            )
 
-            except RateLimitError:
-                # Always retry rate limits
-                delay = self._backoff_delay(attempt)
-                time.sleep(delay)
-
-            except (requests.exceptions.Timeout,
-                    requests.exceptions.ConnectionError,
-                    KVClientError) as e:
-                if attempt == self.max_retries - 1:
-                    raise
-                delay = self._backoff_delay(attempt)
-                time.sleep(delay)
-
-        raise KVClientError("Max retries exceeded")
+        self._consecutive_429 = 0
+        if response.status_code < 400:
+            return response.json()
 
-    def _backoff_delay(self, attempt: int) -> float:
-        exponential = self.backoff_base * (2 ** attempt)
-        jitter = random.uniform(0, self.jitter)
-        return exponential + jitter
+        raise KVClientError(f"{response.status_code}: {response.text}")
 
     # --------------------------------------------------
     # Public API methods
@@ -131,12 +204,15 @@ class KVClient:
             f"/items/{key}",
         )
 
-    def list(self, page: int = 1, page_size: int = 10):
+    def list(self, after_id: Optional[int] = None, page_size: int = 10):
         """
-        GET /items/?page=&page_size=
+        GET /items/?after_id=&page_size=
         """
+        params = {"page_size": page_size}
+        if after_id is not None:
+            params["after_id"] = after_id
         return self._request(
             "GET",
             "/items/",
-            params={"page": page, "page_size": page_size},
+            params=params,
         )
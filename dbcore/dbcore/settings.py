@@ -81,6 +81,18 @@ DATABASES = {
         "PASSWORD": "botgauge_user",
         "HOST": "localhost",
         "PORT": "5432",
+        # Keep connections open between requests instead of paying the
+        # libpq handshake per ORM call; health checks drop stale ones.
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
+        # psycopg 3: bind parameters server-side and PREPARE any
+        # statement seen more than once, so the small fixed set of KV
+        # queries reuses cached plans instead of being re-parsed and
+        # re-planned on every request.
+        "OPTIONS": {
+            "server_side_binding": True,
+            "prepare_threshold": 1,
+        },
     }
 }
 
@@ -12,7 +12,7 @@ client.get("client_test")
 client.update("client_test", "updated")
 
 # List
-client.list(page=1, page_size=5)
+client.list(page_size=5)
 
 # Delete
 client.delete("client_test")